@@ -1,40 +1,147 @@
-import copy
+import functools
+import itertools
 import re
 
 import django
+from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db import models
 from django.db.models import QuerySet
+from django.db.models.query import ModelIterable, ValuesIterable
 from django.db.models.functions import Lower, Upper
-from django.utils import six
-from django.utils.safestring import mark_safe
+from django.utils.functional import cached_property
+from django.utils.safestring import SafeString, mark_safe
 
 from collections import OrderedDict
+from types import MappingProxyType
 
 
 __all__ = ["Column", "Table"]
 
 
-def remote_field(field):
-    """
-    https://docs.djangoproject.com/en/1.9/releases/1.9/#field-rel-changes
-    """
-    if django.VERSION >= (1, 9):
+_TEXT_FIELD_TYPES = (models.CharField, models.TextField, models.EmailField,
+                     models.FileField, models.FilePathField, models.SlugField, models.URLField,
+                     models.UUIDField, models.GenericIPAddressField)
+
+# Field type -> function to make the sort case-insensitive (None to sort by the field name).
+# Subclasses of the field types are added the first time they are sorted.
+_SORT_FUNCTIONS = {field_type: Upper for field_type in _TEXT_FIELD_TYPES}
+
+
+def get_sort_function(field):
+    """Return the function to wrap the sort column with for the field or None."""
+    try:
+        return _SORT_FUNCTIONS[type(field)]
+    except KeyError:
+        func = _SORT_FUNCTIONS[type(field)] = Upper if isinstance(field, _TEXT_FIELD_TYPES) else None
+        return func
+
+
+_TAG_RE = re.compile(r"\{\{([^{}]+)\}\}")
+_BRACE_NORMALIZE = re.compile(r"\{\{ | \}\}")
+_SAFE_TAG_RE = re.compile(r"\{\{ | \}\}|[\"']")
+_SAFE_TAG_REPLACE = {"{{ ": "{{", " }}": "}}", '"': '\\"', "'": "\\'"}
+
+
+def _normalize_braces(tag):
+    """Remove the django spaces inside of the braces ("{{ cell }}" -> "{{cell}}")."""
+    return _BRACE_NORMALIZE.sub(lambda m: "{{" if m.group(0) == "{{ " else "}}", tag)
+
+
+def _escape_tag(tag):
+    """Normalize the braces and escape the quotes of a tag in a single pass."""
+    return _SAFE_TAG_RE.sub(lambda m: _SAFE_TAG_REPLACE[m.group(0)], tag)
+
+
+# https://docs.djangoproject.com/en/1.9/releases/1.9/#field-rel-changes
+if django.VERSION >= (1, 9):
+    def remote_field(field):
         return field.remote_field
-    return field.rel
+else:
+    def remote_field(field):
+        return field.rel
+
+
+def _item_attr_getter(name):
+    """Return a tag getter for "item.<name>"."""
+    def get_attr(obj, cell, row_idx):
+        try:
+            if isinstance(obj, dict) and name in obj:
+                value = obj[name]
+            else:
+                value = getattr(obj, name)
+            if callable(value):
+                value = value()
+        except Exception:
+            value = ""
+        if value is None:
+            value = ""
+        return value
+    return get_attr
+
+
+def _get_item(obj, cell, row_idx):
+    return "" if obj is None else obj
+
+
+def _get_cell(obj, cell, row_idx):
+    return "" if cell is None else cell
+
+
+def _get_row_idx(obj, cell, row_idx):
+    return "" if row_idx is None else row_idx
+
+
+def fetch_cell(obj, name, default=""):
+    """Return the cell value from a dictionary or object row."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def get_cell_fetcher(queryset):
+    """Return the function to read a cell value (obj, name, default) for the rows of a queryset.
+
+    Rows of a QuerySet are all the same type, so dict.get or getattr is used directly. Other iterables use
+    fetch_cell, which checks every row.
+    """
+    if isinstance(queryset, QuerySet):
+        if issubclass(queryset._iterable_class, ValuesIterable):
+            return dict.get
+        elif issubclass(queryset._iterable_class, ModelIterable):
+            return getattr
+    return fetch_cell
+
+
+def is_concrete_field(model, name):
+    """Return if the name is a concrete non-relational field of the model (can be read with QuerySet.values())."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return field.concrete and not field.is_relation
 
 
 def get_all_model_fields(model):
     opts = model._meta
 
     return [Column(f.name, f.verbose_name.title(), f.name)
-            for f in sorted(opts.fields + opts.many_to_many)
+            for f in sorted(itertools.chain(opts.fields, opts.many_to_many))
             if not isinstance(f, models.AutoField) and not (getattr(remote_field(f), 'parent_link', False))]
 
 
-class Column(dict):
+class Column(object):
+    FIELDS = ("name", "display_name", "order_by", "tag", "class_names", "style", "annotate")
+
+    __slots__ = ("name", "display_name", "order_by", "_tag", "class_names", "style", "annotate", "extra", "_program",
+                 "_safe_tag")
+
     def __init__(self, name, display_name=None, order_by=None, tag=None, class_names="", style="", annotate=None):
         d, li = None, None
-        if isinstance(name, dict):
+        if isinstance(name, Column):
+            d = name.to_dict()
+            name = None
+
+        elif isinstance(name, dict):
             d = name
             name = None
 
@@ -42,28 +149,51 @@ class Column(dict):
             li = name
             name = None
 
-        super().__init__(name=name, display_name=display_name, order_by=order_by, tag=tag, class_names=class_names, style=style,
-                         annotate=annotate)
+        self.extra = {}  # Keys of a column dictionary that are not in FIELDS
+        self.name = name
+        self.display_name = display_name
+        self.order_by = order_by
+        self.tag = tag
+        self.class_names = class_names
+        self.style = style
+        self.annotate = annotate
 
         if d is not None:
             self.from_dict(d)
         elif li is not None:
             self.from_list(li)
 
-        if self["display_name"] is None:
-            self["display_name"] = str(self['name']).replace("_", " ").title()
-        if self['order_by'] is None:
-            self['order_by'] = str(self['name'])
+        if self.display_name is None:
+            self.display_name = str(self.name).replace("_", " ").title()
+        if self.order_by is None:
+            self.order_by = str(self.name)
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @tag.setter
+    def tag(self, value):
+        self._tag = value
+        self._program = self._compile_tag(value)
+        self._safe_tag = mark_safe(_escape_tag(value or ""))
+
+    def to_dict(self):
+        """Return the column values (and the extra keys) as a dictionary."""
+        d = {key: getattr(self, key) for key in self.FIELDS}
+        d.update(self.extra)
+        return d
 
     def from_dict(self, d):
-        """Set the values from a dictionary"""
-        self.update(d)
+        """Set the values from a dictionary. Keys that are not in FIELDS are kept in extra."""
+        for key, value in d.items():
+            self[key] = value
 
-        name = self["name"]
-        if self["display_name"] is None and name is not None:
-            self["display_name"] = str(name).replace("_", " ").title()
-        if self['order_by'] is None and name is not None:
-            self['order_by'] = str(name)
+        name = self.name
+        if self.display_name is None and name is not None:
+            self.display_name = str(name).replace("_", " ").title()
+        if self.order_by is None and name is not None:
+            self.order_by = str(name)
 
     def from_list(self, li):
         length = len(li)
@@ -80,15 +210,68 @@ class Column(dict):
         if length > 5:
             self.style = li[5]
 
-        name = self["name"]
-        if self["display_name"] is None and name is not None:
-            self["display_name"] = str(name).replace("_", " ").title()
-        if self['order_by'] is None and name is not None:
-            self['order_by'] = str(name)
+        name = self.name
+        if self.display_name is None and name is not None:
+            self.display_name = str(name).replace("_", " ").title()
+        if self.order_by is None and name is not None:
+            self.order_by = str(name)
 
     def safe_tag(self):
         """Return the tag without django braces and as a safe html string."""
-        return mark_safe(self.tag.replace("{{ ", "{{").replace(" }}", "}}").replace('"', '\\"').replace("'", "\\'"))
+        return self._safe_tag
+
+    @staticmethod
+    def _compile_tag(tag):
+        """Parse a custom tag once into a tree of operations.
+
+        Operations are ("lit", text), ("val", getter) and ("if", getter, then_ops, else_ops). Each getter is
+        resolved here and is called with (obj, cell, row_idx) when the tag is rendered.
+        """
+        if not tag:
+            return [("lit", "")]
+
+        tokens = _TAG_RE.split(_normalize_braces(tag))
+
+        program = []
+        ops = program
+        stack = []  # (parent ops, if op) for each open if condition
+        for i, token in enumerate(tokens):
+            if i % 2 == 0:
+                # Literal text between the variables
+                if token:
+                    ops.append(("lit", token))
+                continue
+
+            val = token.strip()
+            if val.startswith("if "):
+                if_op = ("if", Column._compile_value(val[3:].strip()), [], [])
+                ops.append(if_op)
+                stack.append((ops, if_op))
+                ops = if_op[2]
+            elif val == "else" and stack:
+                ops = stack[-1][1][3]
+            elif val == "endif" and stack:
+                ops = stack.pop()[0]
+            elif val == "else" or val == "endif":
+                # Not inside of an if condition. Keep the text.
+                ops.append(("lit", "{{" + token + "}}"))
+            else:
+                ops.append(("val", Column._compile_value(val)))
+
+        if not program:
+            program.append(("lit", ""))
+        return program
+
+    @staticmethod
+    def _compile_value(val):
+        """Return the getter function for a tag variable."""
+        if val.startswith("item."):
+            return _item_attr_getter(val[5:])
+        elif val == "item":
+            return _get_item
+        elif val == "row_idx":
+            return _get_row_idx
+        return _get_cell
 
     def parse_tag(self, obj, cell, row_idx=None):
         """Parse a custom tag.
@@ -98,98 +281,116 @@ class Column(dict):
              cell (str): object column value
              row_idx (int)[None]: Row index.
         """
-        tag = self.tag.replace("{{ ", "{{").replace(" }}", "}}")
+        program = self._program
+        if len(program) == 1 and program[0][0] == "lit":
+            return program[0][1]
+
+        parts = []
+        stack = [iter(program)]
+        while stack:
+            for op in stack[-1]:
+                kind = op[0]
+                if kind == "lit":
+                    parts.append(op[1])
+                elif kind == "val":
+                    parts.append(str(op[1](obj, cell, row_idx)))
+                else:
+                    # Run the if or else operations then continue with the rest of this list
+                    stack.append(iter(op[2] if op[1](obj, cell, row_idx) else op[3]))
+                    break
+            else:
+                stack.pop()
+        return "".join(parts)
+
+    # ===== Dictionary compatibility (do not use in hot paths) =====
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            return self.extra[key]
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            self.extra[key] = value
+        else:
+            setattr(self, key, value)
 
-        replace_vals = re.findall(r"\{([^{}]+)\}", tag)
-        for val in replace_vals:
-            if val == "endif" or val == "else":
-                continue
+    def __getattr__(self, key):
+        # Only called for names that are not slots. Extra keys can be read as attributes like the old dict Column.
+        try:
+            return object.__getattribute__(self, "extra")[key]
+        except (AttributeError, KeyError):
+            raise AttributeError(key) from None
 
-            # Check for if condition
-            is_if_cond = False
-            if val.startswith("if "):
-                is_if_cond = True
-                val = val[3:]
-
-            # Get the value
-            try:
-                if val.startswith('item.'):
-                    if isinstance(obj, dict) and val[5:] in obj:
-                        value = obj[val[5:]]
-                    else:
-                        value = getattr(obj, val[5:])
-                    if callable(value):
-                        value = value()
-                elif val == "item":
-                    value = obj
-                elif val == "row_idx":
-                    value = row_idx
-                else:
-                    value = cell
-                if value is None:
-                    value = ""
-            except:
-                value = ""
-
-            # Check if
-            if is_if_cond:
-                # Get the if condition positions
-                start = tag.index("{{if "+val+"}}")
-                end = tag.index("{{endif}}") + 9
-                try:
-                    else_idx = tag.index("{{else}}")
-                except ValueError:
-                    # The else condition was not found
-                    else_idx = float("inf")
-
-                if value:
-                    if else_idx < end:
-                        # Remove else part and remove the if condition
-                        tag = tag[: else_idx] + tag[end:]
-                        tag = tag.replace("{{if "+val+"}}", "", 1)
-                    else:
-                        # Remove the if condition (No else statement)
-                        tag = tag.replace("{{if "+val+"}}", "", 1).replace("{{endif}}", "", 1)
-                else:
-                    if else_idx < end:
-                        # Keep else part and remove if condition part
-                        tag = tag[: start] + tag[else_idx + 8:]
-                        tag = tag.replace("{{endif}}", "", 1)
-                    else:
-                        # Remove the entire if block without the value
-                        tag = tag[:start] + tag[end:]
+    def __contains__(self, key):
+        return key in self.FIELDS or key in self.extra
 
-            # Set the value
-            tag = tag.replace("{{" + val + "}}", str(value))
+    def get(self, key, default=None):
+        if key not in self.FIELDS:
+            return self.extra.get(key, default)
+        return getattr(self, key)
 
-        return tag
+    def keys(self):
+        return list(self.FIELDS) + list(self.extra)
 
-    def __setattr__(self, key, value):
-        self[key] = value
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self.to_dict())
+    # ===== END Dictionary compatibility =====
 
-    def __dir__(self):
-        return self.keys()
 
-    def __getattr__(self, key):
-        try:
-            return self[key]
-        except KeyError:
-            raise AttributeError(key)
+def split_annotations(columns, annotations):
+    """Return (static annotations, columns with an annotate function) for the table columns and annotations."""
+    static, callable_cols = dict(annotations), []
+    for col in columns:
+        if col.annotate:
+            if callable(col.annotate):
+                callable_cols.append(col)
+            else:
+                static[col.name] = col.annotate
+    return static, callable_cols
+
+
+class StreamedRows(object):
+    """Rows of a QuerySet that are read in chunks with QuerySet.iterator() when they are iterated.
+
+    The {% for %} tag calls list() on iterables without __len__, which would read every row before the first one
+    is rendered. The length is the QuerySet.count() (a COUNT query unless the rows were already fetched).
+    """
+    __slots__ = ("queryset", "chunk_size")
+
+    def __init__(self, queryset, chunk_size=2000):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __iter__(self):
+        if self.queryset._result_cache is not None:
+            return iter(self.queryset)
+        return self.queryset.iterator(chunk_size=self.chunk_size)
 
 
 class TableOptions(object):
     def __init__(self, options=None):
-        self.model = getattr(options, 'model', None)
-        self.fields = getattr(options, 'fields', None)
-        self.exclude = getattr(options, 'exclude', None)
-        self.sortable = getattr(options, 'sortable', True)
-        self.annotations = getattr(options, "annotations", {})
-
-        self.table_id = getattr(options, 'table_id', "dynamic_table")
-        self.table_class_names = getattr(options, 'table_class_names', "")
-        self.table_style = getattr(options, 'table_style', "")
-        self.row_class_names = getattr(options, 'row_class_names', "")
-        self.row_style = getattr(options, 'row_style', "")
+        d = {}
+        if options is not None:
+            # Read the Meta class attributes once (including the attributes of inherited Meta classes)
+            for klass in reversed(getattr(options, "__mro__", (options,))):
+                d.update({k: v for k, v in vars(klass).items() if not k.startswith("_")})
+
+        self.model = d.get('model', None)
+        self.fields = d.get('fields', None)
+        self.exclude = d.get('exclude', None)
+        self.sortable = d.get('sortable', True)
+        self.use_values = d.get('use_values', False)
+        self.stream_rows = d.get('stream_rows', False)
+        self.annotations = MappingProxyType(dict(d.get("annotations", None) or {}))
+
+        self.table_id = d.get('table_id', "dynamic_table")
+        self.table_class_names = d.get('table_class_names', "")
+        self.table_style = d.get('table_style', "")
+        self.row_class_names = d.get('row_class_names', "")
+        self.row_style = d.get('row_style', "")
 
 
 class TableMetaclass(type):
@@ -197,7 +398,10 @@ class TableMetaclass(type):
         new_class = super(TableMetaclass, cls).__new__(cls, name, bases, attrs)
         new_class._meta = TableOptions(getattr(new_class, "Meta", None))
         new_class.base_columns = new_class.get_columns()
-        new_class.annotations = copy.deepcopy(new_class._meta.annotations)
+        new_class._annotations = new_class._meta.annotations
+
+        # Split the annotations once, so annotate does not check every column for every queryset
+        new_class._annotation_split = split_annotations(new_class.base_columns, new_class._annotations)
 
         return new_class
 
@@ -206,12 +410,25 @@ class BaseTable(object):
 
     order_by_name = "order_by"
 
+    _annotations = MappingProxyType({})
+    _annotation_split = None  # (static annotations, columns with an annotate function), see split_annotations
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # A class attribute would hide the annotations property, which clears the annotation split
+        annotations = cls.__dict__.get("annotations", None)
+        if annotations is not None and not isinstance(annotations, property):
+            del cls.annotations
+            cls._annotations = MappingProxyType(dict(annotations))
+            cls._annotation_split = None
+
     def __init__(self, queryset=None, order_by=None, parent=None):
         if not hasattr(self, "base_columns"):
             self.base_columns = []
-        if not hasattr(self, "annotations"):
-            self.annotations = {}
-        self.columns = [d for d in self.base_columns]
+        self._columns = [d for d in self.base_columns]  # Keeps the class annotation split
+        self._renderers = {id(col): self.get_renderer(col) for col in self.columns}
+        self._can_use_values = self.use_values and self.can_use_values()
         self.queryset = queryset
         self.order_by = None
         self.ordering = None
@@ -219,23 +436,63 @@ class BaseTable(object):
 
         self.queryset = self.get_queryset(queryset, parent=parent)
 
+    @property
+    def queryset(self):
+        return self._queryset
+
+    @queryset.setter
+    def queryset(self, queryset):
+        self._queryset = queryset
+
+        # The rows of a queryset are all the same type. Pick the cell lookup once instead of for every cell.
+        self._fetch = get_cell_fetcher(queryset)
+
     def get_queryset(self, queryset, parent=None):
         """Take the original queryset and the possible parent object and return the queryset to be used."""
-        return self.sort(self.annotate(queryset, parent=parent), parent=parent)
+        qs = self.sort(self.annotate(queryset, parent=parent), parent=parent)
+        if self._can_use_values and isinstance(qs, QuerySet):
+            # Only read the column values from the database instead of creating model objects
+            qs = qs.values(*(col.name for col in self.columns))
+        return qs
+
+    def can_use_values(self):
+        """Return if every column is a plain model field, so the rows can be read with QuerySet.values().
+
+        Columns with a tag, an annotation, or a render_<name> method need the model object.
+        """
+        model = self._meta.model
+        if model is None or self.annotations:
+            return False
+        return all(not col.tag and not col.annotate and not hasattr(self, "render_"+str(col.name)) and
+                   is_concrete_field(model, col.name)
+                   for col in self.columns)
+
+    @property
+    def annotations(self):
+        return self._annotations
+
+    @annotations.setter
+    def annotations(self, annotations):
+        self._annotations = annotations
+        self._annotation_split = None
 
     def annotate(self, qs, parent=None):
-        """Annotate the queryset from the column annotations."""
-        annotate = copy.deepcopy(self.annotations)
-        for col in self.columns:
-            if col.annotate:
-                if callable(col.annotate):
-                    qs = col.annotate(col.name, qs, parent)
-                else:
-                    annotate[col.name] = col.annotate
+        """Annotate the queryset from the column annotations.
 
-        if len(annotate) == 0:
-            return qs
-        return qs.annotate(**annotate)
+        The annotations are split from the columns once per table class, or again after the columns or annotations
+        of the table are set. The annotation expressions are shared with the table class. Do not modify them in
+        place.
+        """
+        split = self._annotation_split
+        if split is None:
+            split = self._annotation_split = split_annotations(self.columns, self.annotations)
+
+        static, callable_cols = split
+        for col in callable_cols:
+            qs = col.annotate(col.name, qs, parent)
+        if static:
+            qs = qs.annotate(**static)
+        return qs
 
     def sort(self, qs, parent=None):
         """Sort the queryset."""
@@ -250,10 +507,21 @@ class BaseTable(object):
 
     @classmethod
     def get_ordering(cls, order_by):
+        return cls._cached_ordering(order_by)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _cached_ordering(cls, order_by):
+        """Return the ordering expressions for an order_by string (cached per table class)."""
         return tuple(cls._get_special_ordering(o) for o in order_by.split(','))
 
     @classmethod
+    @functools.lru_cache(maxsize=128)
     def _get_special_ordering(cls, sort_name):
+        """Return the ordering expression for a single sort name (cached per table class).
+
+        The model fields do not change after the apps are loaded, so the field lookups are only done once.
+        """
         model = cls._meta.model
         col = sort_name
 
@@ -273,22 +541,29 @@ class BaseTable(object):
                 model = sub.target_field.model
 
             field = model._meta.get_field(sub_col)
-        except:
+        except (FieldDoesNotExist, FieldError, AttributeError):
             return sort_name
 
         # Check if some sort of text field (Do not do this for number field)
-        if isinstance(field, (models.CharField, models.TextField, models.EmailField,
-                              models.FileField, models.FilePathField, models.SlugField, models.URLField,
-                              models.UUIDField, models.GenericIPAddressField)):
+        sort_func = get_sort_function(field)
+        if sort_func is not None:
             if negative:
-                return Upper(col).desc()
-            return Upper(col)
+                return sort_func(col).desc()
+            return sort_func(col)
         return sort_name
 
     @property
     def sortable(self):
         return self._meta.sortable
 
+    @property
+    def use_values(self):
+        return self._meta.use_values
+
+    @property
+    def stream_rows(self):
+        return self._meta.stream_rows
+
     @property
     def table_id(self):
         return self._meta.table_id
@@ -310,8 +585,18 @@ class BaseTable(object):
         return self._meta.row_style
 
     @property
+    def columns(self):
+        return self._columns
+
+    @columns.setter
+    def columns(self, columns):
+        self._columns = columns
+        self._annotation_split = None
+        self.__dict__.pop("headers", None)  # Clear the cached headers
+
+    @cached_property
     def headers(self):
-        return [d["display_name"] for d in self.columns]
+        return [col.display_name for col in self.columns]
 
     @classmethod
     def get_columns(cls):
@@ -355,6 +640,49 @@ class BaseTable(object):
 
         return fields
 
+    def iterate_rows(self, chunk_size=2000):
+        """Return the rows the table template loops over.
+
+        If Meta.stream_rows is True the QuerySet rows are fetched in chunks with QuerySet.iterator() (see
+        StreamedRows) and are not kept in the QuerySet result cache. Every loop over the rows then runs the query
+        again, and prefetch_related is ignored before Django 4.1.
+        """
+        qs = self.queryset
+        if self.stream_rows and isinstance(qs, QuerySet):
+            return StreamedRows(qs, chunk_size)
+        return qs
+
+    def get_renderer(self, col):
+        """Return the function that renders a cell for the column.
+
+        The function is called with (obj, cell, row_idx) and is resolved once per column instead of per cell.
+
+        Args:
+             col (Column): Column dictionary
+        """
+        # Tag for ajax compatibility
+        if col.tag:
+            def render_tag(obj, cell, row_idx=None):
+                return mark_safe(col.parse_tag(obj, cell, row_idx=row_idx))
+            return render_tag
+
+        render_method = getattr(self, "render_"+str(col.name), None)
+        if render_method is not None:
+            def render_custom(obj, cell, row_idx=None):
+                return mark_safe(render_method(obj, cell, row_idx=row_idx))
+            return render_custom
+
+        def render_cell(obj, cell, row_idx=None):
+            cell_type = type(cell)
+            if cell_type is SafeString:
+                return cell
+            elif cell is None:
+                return mark_safe("")
+            elif cell_type is str:
+                return mark_safe(cell)
+            return mark_safe(str(cell))
+        return render_cell
+
     def render(self, obj, col, row_idx=None):
         """Return the template html text for the row and column
 
@@ -363,24 +691,18 @@ class BaseTable(object):
              col (Column): Column dictionary
              row_idx (int)[None]: Row index.
         """
-        if isinstance(obj, dict):
-            cell = obj.get(col.name, "")
-        else:
-            cell = getattr(obj, col.name, "")
+        cell = self._fetch(obj, col.name, "")
         if callable(cell):
             cell = cell()
 
-        # Tag for ajax compatibility
-        if col.tag:
-            return mark_safe(col.parse_tag(obj, cell, row_idx=row_idx))
-
-        elif hasattr(self, "render_"+col.name):
-            return mark_safe(getattr(self, "render_"+col.name)(obj, cell, row_idx=row_idx))
-        else:
-            return mark_safe(str(cell))
+        renderer = self._renderers.get(id(col))
+        if renderer is None:
+            # Column was not in the table's columns when the table was created
+            renderer = self.get_renderer(col)
+        return renderer(obj, cell, row_idx=row_idx)
 
 
-class Table(six.with_metaclass(TableMetaclass, BaseTable)):
+class Table(BaseTable, metaclass=TableMetaclass):
     pass
 
 
@@ -1,65 +1,59 @@
+import functools
+import re
+
 from django import template
 
 register = template.Library()
 
+_EMPTY_URLS = ("?", "?page=", "?order_by=")  # _compute_urls("", "page", "order_by")
+
+
+@functools.lru_cache(maxsize=None)
+def _strip_param_re(name):
+    """Return the compiled regex that matches a query string parameter with its leading "&"."""
+    return re.compile(r"(?:^|&)" + re.escape(name) + r"(?:=[^&]*)?(?=&|$)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compute_urls(query_string, page_name, order_by_name):
+    """Return (base_url, base_page_url, base_order_by_url) for the raw query string.
+
+    base_page_url and base_order_by_url end with "page_name=" and "order_by_name=" so the value can be appended
+    in the template.
+    """
+    def modify_url(name):
+        body = _strip_param_re(name).sub("", query_string).lstrip("&")
+        return ("?" + body + "&" if body else "?") + name + "="
+
+    return "?" + query_string, modify_url(page_name), modify_url(order_by_name)
+
 
 def get_url_modifiers(context):
     # ===== Sorting and Filtering support =====
-    if "base_url" not in context:
+    if "base_url" in context:
+        base_url = context["base_url"]
+        query_string = base_url[1:] if base_url.startswith("?") else base_url
+    else:
         try:
-            base_url = "?" + context["request"].get_full_path().split("?", 1)[1]
-        except IndexError:
-            base_url = "?"
-        context["base_url"] = base_url
+            query_string = context["request"].META.get("QUERY_STRING", "")
+        except (KeyError, AttributeError):
+            query_string = ""
+
+    view = context.get("view", None)
+    page_name = getattr(view, "page_kwarg", None) or "page"
+    order_by_name = getattr(view, "order_by_name", None) or "order_by"
+
+    if not query_string and page_name == "page" and order_by_name == "order_by":
+        base_url, base_page_url, base_order_by_url = _EMPTY_URLS
     else:
-        base_url = context["base_url"]
+        base_url, base_page_url, base_order_by_url = _compute_urls(query_string, page_name, order_by_name)
     # ===== END Sorting =====
 
-    # ===== Modify Page URL =====
+    if "base_url" not in context:
+        context["base_url"] = base_url
     if "base_page_url" not in context:
-        try:
-            page_name = context["view"].page_kwarg
-        except:
-            page_name = "page"
-        try:
-            if page_name+"=" in base_url:
-                start, end = base_url.split(page_name+"=", 1)
-                if "&" in end:
-                    rm, end = end.split("&", 1)
-                else:
-                    end = ""
-                    if start.endswith("&"):
-                        start = start[:-1]
-                base_page_url = start + end + "&"+page_name+"="  # should end with "&"
-            else:
-                base_page_url = base_url + "&"+page_name+"="
-        except IndexError:
-            base_page_url = "?"+page_name+"="
         context["base_page_url"] = base_page_url
-    # ===== END Modify Page URL =====
-
-    # ===== Modify order_by URL =====
     if "base_order_by_url" not in context:
-        try:
-            order_by_name = context["view"].order_by_name
-        except:
-            order_by_name = "order_by"
-
-        try:
-            if order_by_name+"=" in base_url:
-                start, end = base_url.split(order_by_name+"=", 1)
-                if "&" in end:
-                    rm, end = end.split("&", 1)
-                else:
-                    end = ""
-                    if start.endswith("&"):
-                        start = start[:-1]
-                base_order_by_url = start + end + "&"+order_by_name+"="  # should end with "&"
-            else:
-                base_order_by_url = base_url + "&"+order_by_name+"="
-        except IndexError:
-            base_order_by_url = "?"+order_by_name+"="
         context["base_order_by_url"] = base_order_by_url
-    # ===== END Modify order_by URL =====
 
     return context
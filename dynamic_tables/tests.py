@@ -1,3 +1,337 @@
-from django.test import TestCase
+import datetime
+import decimal
+import json
 
-# Create your tests here.
+from django.core.paginator import Paginator
+from django.db import models
+from django.db.models import Count, F
+from django.http import JsonResponse
+from django.template import Context, Engine
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from django.views.generic import DetailView, ListView
+
+from .tables import BaseTable, Column, Table, TableOptions
+from .views import AjaxableResponseMixin, PkSlicePaginator, can_use_pk_slice, get_context_object_name, json_response
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "dynamic_tables"
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "dynamic_tables"
+
+
+class Book(models.Model):
+    title = models.CharField(max_length=50)
+    pages = models.IntegerField(default=0)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="books")
+    tags = models.ManyToManyField(Tag, related_name="books")
+
+    class Meta:
+        app_label = "dynamic_tables"
+        ordering = ["id"]
+
+    def __str__(self):
+        return "Book " + self.title
+
+    def get_absolute_url(self):
+        return "/book/%s" % self.pk
+
+
+class BookDataMixin(object):
+    @classmethod
+    def setUpTestData(cls):
+        authors = [Author.objects.create(name=name) for name in ("a", "b")]
+        cls.tags = [Tag.objects.create(name=name) for name in ("x", "y", "z")]
+        for i in range(23):
+            book = Book.objects.create(title="t%02d" % i, pages=i, author=authors[i % 2])
+            book.tags.set(cls.tags[:i % 4])
+
+
+class PkSlicePaginatorTestCase(BookDataMixin, TestCase):
+    def assert_same_pages(self, queryset, per_page=3, **kwargs):
+        expected = Paginator(queryset, per_page, **kwargs)
+        paginator = PkSlicePaginator(queryset, per_page, **kwargs)
+        self.assertEqual(paginator.count, expected.count)
+        self.assertEqual(paginator.num_pages, expected.num_pages)
+        for number in expected.page_range:
+            self.assertEqual(list(paginator.page(number).object_list), list(expected.page(number).object_list),
+                             "page %s" % number)
+
+    def test_plain_queryset(self):
+        self.assert_same_pages(Book.objects.all())
+        self.assert_same_pages(Book.objects.order_by("-pages"), per_page=5, orphans=2)
+
+    def test_deep_page_uses_pk_subquery(self):
+        page = PkSlicePaginator(Book.objects.all(), 3).page(3)
+        self.assertIn("IN (SELECT", str(page.object_list.query))
+
+    @override_settings(DYNAMIC_TABLES_FAST_COUNT=False)
+    def test_grouped_values(self):
+        self.assert_same_pages(Book.objects.values("author").annotate(n=Count("id")).order_by("author"), per_page=1)
+
+    def test_grouped_values_count(self):
+        queryset = Book.objects.values("author").annotate(n=Count("id")).order_by("author")
+        self.assertEqual(PkSlicePaginator(queryset, 1).count, 2)
+        self.assert_same_pages(queryset, per_page=1)
+
+    def test_annotation_count(self):
+        queryset = Book.objects.annotate(author_name=F("author__name"))
+        self.assertEqual(PkSlicePaginator(queryset, 3).count, 23)
+        self.assert_same_pages(queryset)
+
+    def test_aggregate_annotation(self):
+        self.assert_same_pages(Book.objects.annotate(n=Count("tags")))
+
+    def test_union(self):
+        queryset = Book.objects.filter(pages__lt=6).order_by().union(
+            Book.objects.filter(pages__gt=17).order_by()).order_by("pages")
+        self.assert_same_pages(queryset, per_page=2)
+
+    def test_multi_valued_join(self):
+        self.assert_same_pages(Book.objects.filter(tags__name__in=["x", "y"]).order_by("id"))
+        self.assert_same_pages(Book.objects.filter(tags__name__in=["x", "y"]).distinct().order_by("id"))
+
+    def test_multi_valued_ordering(self):
+        queryset = Book.objects.order_by("-tags", "id")
+        self.assertFalse(can_use_pk_slice(queryset))
+        self.assert_same_pages(queryset, per_page=5)
+        paginator = PkSlicePaginator(queryset, 5)
+        for number in paginator.page_range[:-1]:
+            self.assertEqual(len(paginator.page(number).object_list), 5)
+
+        # Every page of the first 8 books (0-3 tags each) has distinct books when ordered by tag name
+        queryset = Book.objects.filter(pages__lt=8).order_by("tags__name", "id")
+        self.assert_same_pages(queryset)
+        paginator = PkSlicePaginator(queryset, 3)
+        for number in paginator.page_range:
+            pks = [book.pk for book in paginator.page(number).object_list]
+            self.assertLessEqual(len(pks), 3)
+            self.assertEqual(len(pks), len(set(pks)))
+
+        self.assertFalse(can_use_pk_slice(Book.objects.order_by(F("tags__name").desc())))
+        self.assertFalse(can_use_pk_slice(Author.objects.order_by("books__pages")))
+        self.assertTrue(can_use_pk_slice(Book.objects.order_by("author__name", "-pk")))
+
+    def test_sliced_queryset(self):
+        self.assert_same_pages(Book.objects.all()[:10])
+
+    def test_list(self):
+        self.assert_same_pages(list(Book.objects.all()))
+
+
+class TableAnnotateTestCase(BookDataMixin, TestCase):
+    def test_base_table_without_metaclass(self):
+        class PlainTable(BaseTable):
+            _meta = TableOptions()
+            base_columns = [Column("title"), Column("dbl", annotate=F("pages") * 2)]
+            annotations = {"tri": F("pages") * 3}
+
+        row = PlainTable(Book.objects.filter(pages=3)).queryset[0]
+        self.assertEqual((row.dbl, row.tri), (6, 9))
+
+    def test_instance_columns_and_annotations(self):
+        class BookTable(Table):
+            class Meta:
+                model = Book
+                fields = ["title", "pages"]
+
+        table = BookTable(Book.objects.all())
+        self.assertIs(table._annotation_split, BookTable._annotation_split)  # Not split again per instance
+
+        table.columns = table.columns + [Column("dbl", annotate=F("pages") * 2)]
+        row = table.annotate(Book.objects.filter(pages=3))[0]
+        self.assertEqual(row.dbl, 6)
+        table.annotations = {"tri": F("pages") * 3}
+        row = table.annotate(Book.objects.filter(pages=3))[0]
+        self.assertEqual((row.dbl, row.tri), (6, 9))
+
+
+class StreamRowsTestCase(BookDataMixin, TestCase):
+    template = Engine().from_string("{% for row in table.iterate_rows %}{{ row.title }}"
+                                    "{% if not forloop.last %},{% endif %}{% endfor %}")
+
+    def make_table(self, stream):
+        class BookTable(Table):
+            class Meta:
+                model = Book
+                fields = ["title"]
+                stream_rows = stream
+
+        return BookTable(Book.objects.filter(pages__lt=4))
+
+    def test_stream_rows(self):
+        table = self.make_table(True)
+        with self.assertNumQueries(2):  # COUNT for the {% for %} length, then the rows
+            self.assertEqual(self.template.render(Context({"table": table})), "t00,t01,t02,t03")
+        self.assertIsNone(table.queryset._result_cache)
+
+    def test_queryset_rows(self):
+        table = self.make_table(False)
+        self.assertIs(table.iterate_rows(), table.queryset)
+        self.assertEqual(self.template.render(Context({"table": table})), "t00,t01,t02,t03")
+        self.assertIsNotNone(table.queryset._result_cache)
+
+        # Rows that were already fetched are not read again
+        table = self.make_table(True)
+        list(table.queryset)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.template.render(Context({"table": table})), "t00,t01,t02,t03")
+
+
+class JsonResponseTestCase(SimpleTestCase):
+    def assert_same_json(self, data):
+        response = json_response(data)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), json.loads(JsonResponse(data).content))
+
+    def test_values(self):
+        self.assert_same_json({"data": [{"name": "a", "count": 1, "price": decimal.Decimal("1.50"), "none": None}]})
+
+    def test_datetimes(self):
+        self.assert_same_json({"datetime": datetime.datetime(2020, 1, 2, 3, 4, 5, 678901),
+                               "aware": datetime.datetime(2020, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+                               "date": datetime.date(2020, 1, 2), "time": datetime.time(3, 4, 5, 678901)})
+
+    def test_non_str_keys(self):
+        self.assert_same_json({1: "a", 2: {3: "b"}})
+
+    def test_big_int(self):
+        self.assert_same_json({"big": 2 ** 70})
+
+    def test_safe(self):
+        with self.assertRaises(TypeError):
+            json_response([1, 2])
+        with self.assertRaises(TypeError):
+            json_response([2 ** 70])
+        response = json_response([1, {"a": 2}], safe=False)
+        self.assertEqual(json.loads(response.content), [1, {"a": 2}])
+        response = json_response([2 ** 70], safe=False)
+        self.assertEqual(json.loads(response.content), [2 ** 70])
+
+
+class ColumnTestCase(SimpleTestCase):
+    def test_dict_compatibility(self):
+        col = Column({"name": "first_name", "width": 3})
+        self.assertEqual(dict(col), {"name": "first_name", "display_name": "First Name", "order_by": "first_name",
+                                     "tag": None, "class_names": "", "style": "", "annotate": None, "width": 3})
+        self.assertEqual(json.loads(json.dumps(col.to_dict()))["width"], 3)
+        self.assertEqual((col["width"], col.width, col.get("width"), "width" in col), (3, 3, 3, True))
+        self.assertEqual(Column(col).extra, {"width": 3})
+
+        col["style"] = "color: red"
+        self.assertEqual(col.style, "color: red")
+        self.assertIsNone(col.get("missing"))
+        with self.assertRaises(KeyError):
+            col["missing"]
+        with self.assertRaises(AttributeError):
+            col.missing
+
+
+class TagItem(object):
+    name = "bob"
+    flag = 1
+    empty = 0
+    none = None
+
+    def get_absolute_url(self):
+        return "/u/1"
+
+    def __repr__(self):
+        return "TagItem()"
+
+
+class ColumnTagTestCase(SimpleTestCase):
+    def assert_tag(self, tag, item, cell, expected):
+        self.assertEqual(Column("n", tag=tag).parse_tag(item, cell, row_idx=3), expected, tag)
+
+    def test_plain(self):
+        for item in (TagItem(), {"name": "d"}):
+            self.assert_tag("", item, "C", "")
+            self.assert_tag("plain", item, "C", "plain")
+            self.assert_tag("{x}{{foo}}", item, "C", "{x}C")
+
+    def test_variables(self):
+        self.assert_tag("<a href='{{ item.get_absolute_url }}'>{{ cell }}</a>", TagItem(), "C", "<a href='/u/1'>C</a>")
+        self.assert_tag("<a href='{{ item.get_absolute_url }}'>{{ cell }}</a>", {"name": "d"}, "", "<a href=''></a>")
+        self.assert_tag("{{item}}-{{row_idx}}-{{cell}}", TagItem(), "C", "TagItem()-3-C")
+        self.assert_tag("{{item.name}}{{item.name}}", TagItem(), "C", "bobbob")
+        self.assert_tag("{{item.name}}{{item.name}}", {"name": "d"}, "C", "dd")
+        self.assert_tag("{{item.none}}|{{item.missing}}", TagItem(), "C", "|")
+        self.assert_tag("{{item.none}}|{{item.missing}}", {}, "C", "|")
+
+    def test_conditions(self):
+        for item in (TagItem(), {"flag": 1, "empty": 0}):
+            self.assert_tag("{{if item.flag}}Y{{else}}N{{endif}}|{{ cell }}", item, "C", "Y|C")
+            self.assert_tag("{{if item.empty}}Y{{else}}N{{endif}}", item, "C", "N")
+            self.assert_tag("{{if item.empty}}Y{{endif}}x", item, "C", "x")
+            self.assert_tag("{{if item.flag}}Y{{endif}}x", item, "C", "Yx")
+            self.assert_tag("{{ if item.flag }}a{{ endif }}", item, "", "a")
+            self.assert_tag("{{if cell}}[{{cell}}]{{endif}}", item, "C", "[C]")
+            self.assert_tag("{{if cell}}[{{cell}}]{{endif}}", item, "", "")
+
+
+class BookJsonView(AjaxableResponseMixin, ListView):
+    model = Book
+    ajax_include_str = False
+
+
+class FormatJsonValuesTestCase(BookDataMixin, TestCase):
+    def assert_same_json(self, **kwargs):
+        queryset = Book.objects.all()
+        expected = BookJsonView(**kwargs).format_json_data(queryset)
+        for d in expected:
+            del d["get_absolute_url"]  # Model method, QuerySet.values() only reads the fields
+        self.assertEqual(BookJsonView(ajax_use_values=True, **kwargs).format_json_data(queryset), expected)
+        return expected
+
+    def test_model_fields(self):
+        data = self.assert_same_json()
+        self.assertEqual(len(data), 23)
+        self.assertEqual(set(data[3]), {"row_idx", "id", "title", "pages", "author_id"})
+        self.assertEqual((data[3]["title"], data[3]["pages"]), ("t03", 3))
+
+    def test_json_fields(self):
+        data = self.assert_same_json(ajax_json_fields=["title", "author_id"])
+        self.assertEqual(set(data[0]), {"row_idx", "title", "author_id"})
+
+
+class ContextObjectNameTestCase(SimpleTestCase):
+    def test_views(self):
+        self.assertEqual(get_context_object_name(ListView(model=Book, object_list=Book.objects.none())), "book_list")
+        self.assertEqual(get_context_object_name(DetailView(object=Book(title="t"))), "book")
+        self.assertEqual(get_context_object_name(DetailView(context_object_name="item")), "item")
+
+    def test_other_signature(self):
+        class NoArgsView(ListView):
+            def get_context_object_name(self):
+                return "no_args"
+
+        class OtherArgsView(ListView):
+            context_object_name = "fallback"
+
+            def get_context_object_name(self, a, b):
+                return "other_args"
+
+        self.assertEqual(get_context_object_name(NoArgsView(object_list=None)), "no_args")
+        self.assertEqual(get_context_object_name(OtherArgsView(object_list=None)), "fallback")
+
+    def test_override_error(self):
+        class BrokenView(ListView):
+            context_object_name = "fallback"
+
+            def get_context_object_name(self, object_list):
+                return None + 1
+
+        view = BrokenView(object_list=None)
+        with self.assertRaises(TypeError):
+            get_context_object_name(view)
+        self.assertIsNone(getattr(view, "_context_object_name", None))
@@ -1,62 +1,274 @@
-from django.core.exceptions import ImproperlyConfigured
-from django.core.paginator import InvalidPage, Paginator
-from django.db.models import Model, QuerySet, TextField, CharField, EmailField, FileField, SlugField, \
-    URLField, UUIDField, GenericIPAddressField, FilePathField
-from django.db.models.functions import Lower
-from django.http import JsonResponse, Http404
-from django.urls import reverse
+import inspect
+import operator
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F, Model, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.manager import BaseManager
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse
+from django.urls import NoReverseMatch, reverse
+from django.utils.functional import cached_property
 from django.views.generic.detail import SingleObjectMixin
-from django.views.generic.list import MultipleObjectMixin, MultipleObjectTemplateResponseMixin
+from django.views.generic.list import MultipleObjectMixin
 from django.views.generic import edit
 
-__all__ = ["FilterMixin", "SortableTableMixin", "PaginatorMixin", "AjaxableResponseMixin",
+from .tables import is_concrete_field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ["PkSlicePaginator", "FilterMixin", "SortableTableMixin", "PaginatorMixin", "AjaxableResponseMixin",
            "PaginatedTableMixin", "AjaxTableMixin",
            "FormMixin", "FormListView"]
 
 
-def get_context_object_name(view):
-    """Return the context_object_name for a view or None."""
-    try:
-        if isinstance(view, MultipleObjectMixin):
-            return view.get_context_object_name(object_list=view.object_list)
-        elif isinstance(view, SingleObjectMixin):
-            return view.get_context_object_name(view.object)
-        else:
-            return view.get_context_object_name()
-    except:
+def _has_multi_valued_join(query):
+    """Return if the query joins a reverse ForeignKey or ManyToManyField (the join can repeat rows)."""
+    for join in query.alias_map.values():
+        join_field = getattr(join, "join_field", None)  # The base table has no join_field
+        if join_field is None:
+            continue
+        path_infos = getattr(join_field, "path_infos", None) or join_field.get_path_info()
+        if any(path.m2m for path in path_infos):
+            return True
+    return False
+
+
+def _lookup_is_multi_valued(opts, lookup, seen=()):
+    """Return if ordering by the lookup (a__b__c) crosses a reverse ForeignKey or ManyToManyField.
+
+    Ordering by a ForeignKey orders by the related model's Meta.ordering, which is checked too.
+    """
+    for name in lookup.split(LOOKUP_SEP):
+        if name == "pk":
+            return False
         try:
-            return view.get_context_object_name()
-        except:
-            pass
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            return False  # A transform or an unknown name
+        if field.many_to_many or field.one_to_many:
+            return True
+        if not field.is_relation:
+            return False
+        opts = field.related_model._meta
+
+    if opts in seen:
+        return False
+    return any(_lookup_is_multi_valued(opts, lookup, seen + (opts,))
+               for lookup in _ordering_lookups(opts.ordering))
+
+
+def _ordering_lookups(ordering):
+    """Yield the field lookups of order_by() items (names and the F() names in expressions)."""
+    for item in ordering:
+        if isinstance(item, str):
+            if item != "?":
+                yield item.lstrip("-+")
+        else:
+            expressions = [item]
+            while expressions:
+                expression = expressions.pop()
+                if isinstance(expression, F):
+                    yield expression.name
+                elif hasattr(expression, "get_source_expressions"):
+                    expressions.extend(e for e in expression.get_source_expressions() if e is not None)
+
+
+def _orders_by_multi_valued(query):
+    """Return if the ordering of the query joins a reverse ForeignKey or ManyToManyField.
+
+    order_by() joins are only added to the query's alias_map when the query is compiled.
+    """
+    opts = query.get_meta()
+    ordering = list(query.order_by) or (list(opts.ordering) if query.default_ordering else [])
+    ordering.extend(query.extra_order_by)
+    return any(lookup not in query.annotations and lookup not in query.extra and
+               _lookup_is_multi_valued(opts, lookup)
+               for lookup in _ordering_lookups(ordering))
+
+
+def _has_aggregate(query):
+    """Return if the query groups rows (GROUP BY or an aggregate annotation)."""
+    return bool(query.group_by) or any(getattr(annotation, "contains_aggregate", False)
+                                       for annotation in query.annotations.values())
+
+
+def can_use_pk_slice(queryset):
+    """Return if a page of the queryset can be selected with pk__in=queryset.values("pk")[bottom:top].
+
+    Only plain model queries give the same rows. Combined (union), sliced and grouped queries, queries with a
+    multi-valued join (without distinct) and queries ordered across a multi-valued relation do not.
+    """
+    query = queryset.query
+    return (not query.combinator and query.can_filter() and not _has_aggregate(query) and
+            (query.distinct or not _has_multi_valued_join(query)) and not _orders_by_multi_valued(query))
+
+
+class PkSlicePaginator(Paginator):
+    """Paginator that selects the primary keys of a page first and then selects the rows by primary key.
+
+    The database only has to skip over the primary keys for deep pages instead of the full rows
+    (SELECT ... WHERE pk IN (SELECT pk ... LIMIT n OFFSET m)). The first page, lists, querysets that are not a plain
+    model query (see can_use_pk_slice) and databases that do not support a LIMIT in an IN subquery (MySQL) use the
+    normal slice.
+
+    Querysets with non-aggregate annotations are counted over the primary key only
+    (QuerySet.values("pk").order_by().count()), so the count subquery does not select the annotations. Grouped,
+    distinct, combined and sliced querysets use the normal count. Set settings.DYNAMIC_TABLES_FAST_COUNT = False to
+    disable.
+    """
+    use_pk_slice = True
+
+    @cached_property
+    def count(self):
+        """Return the total number of objects, across all pages."""
+        object_list = self.object_list
+        if isinstance(object_list, QuerySet) and getattr(settings, "DYNAMIC_TABLES_FAST_COUNT", True):
+            query = object_list.query
+            if (query.annotations and not query.distinct and not query.combinator and query.can_filter() and
+                    not _has_aggregate(query)):
+                return object_list.values("pk").order_by().count()
+        return super().count
+
+    def page(self, number):
+        """Return a Page object for the given 1-based page number."""
+        object_list = self.object_list
+        if not self.use_pk_slice or not isinstance(object_list, QuerySet) or not can_use_pk_slice(object_list):
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        features = connections[object_list.db].features
+        if bottom == 0 or not getattr(features, "allow_sliced_subqueries_with_in", True):
+            page_list = object_list[bottom:top]
+        else:
+            page_list = object_list.filter(pk__in=object_list.values("pk")[bottom:top])
+        return self._get_page(page_list, number, self)
+
+
+_context_name_resolvers = {}
+
 
+def _accepts(func, *args, **kwargs):
+    """Return if the function can be called with the arguments (checks the signature without calling it)."""
     try:
-        return view.context_object_name
-    except:
+        inspect.signature(func).bind(*args, **kwargs)
+    except TypeError:
+        return False
+    except ValueError:  # No signature available
+        return True
+    return True
+
+
+def _get_context_name_resolver(view):
+    """Return the function that gets the context_object_name for the view class (cached per class).
+
+    The get_context_object_name signature is checked once, so a TypeError raised inside an override is not
+    mistaken for an override with a different signature.
+    """
+    view_class = type(view)
+    try:
+        return _context_name_resolvers[view_class]
+    except KeyError:
         pass
 
+    method = getattr(view, "get_context_object_name", None)
+    if method is None:
+        def resolver(view):
+            return getattr(view, "context_object_name", None)
+    elif issubclass(view_class, MultipleObjectMixin) and _accepts(method, object_list=None):
+        def resolver(view):
+            return view.get_context_object_name(object_list=getattr(view, "object_list", None))
+    elif issubclass(view_class, SingleObjectMixin) and _accepts(method, None):
+        def resolver(view):
+            return view.get_context_object_name(getattr(view, "object", None))
+    elif _accepts(method):
+        def resolver(view):
+            return view.get_context_object_name()
+    else:
+        # get_context_object_name was overridden with a different signature
+        def resolver(view):
+            return getattr(view, "context_object_name", None)
+
+    _context_name_resolvers[view_class] = resolver
+    return resolver
+
+
+def get_context_object_name(view):
+    """Return the context_object_name for a view or None.
+
+    A found name is stored on the view (_context_object_name) for the rest of the request.
+    """
+    name = getattr(view, "_context_object_name", None)
+    if name is not None:
+        return name
+
+    name = _get_context_name_resolver(view)(view)
+    if name:
+        view._context_object_name = name
+    return name
+
 
 class ViewMixin(object):
     context_content_name = None
     model = None
 
-    def __init__(self, *args, **kwargs):
-        self.content_parent = None
-        self.content_raw = None
-        self._modified_qs = None
+    # Per request state
+    content_parent = None
+    content_raw = None
+    _modified_qs = None
+    _context_object_name = None
+    _context_content_name = None
+
+    # Class capabilities (used instead of isinstance checks). Set by the mixins and __init_subclass__.
+    _is_paginator = False
+    _is_sortable = False
+    _is_multiple_object = False
+    _is_single_object = False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._is_multiple_object = issubclass(cls, MultipleObjectMixin)
+        cls._is_single_object = issubclass(cls, SingleObjectMixin)
+
+    def __init__(self, *args, **kwargs):
         # Prevent AttributeError
         if not hasattr(self, "request"):
             self.request = None
-        if isinstance(self, MultipleObjectMixin):
+        if self._is_multiple_object:
             self.object_list = None
-        elif isinstance(self, SingleObjectMixin):
+        elif self._is_single_object:
             self.object = None
 
         super().__init__(*args, **kwargs)
 
+    def dispatch(self, request, *args, **kwargs):
+        self._context_object_name = None
+        self._context_content_name = None
+        return super().dispatch(request, *args, **kwargs)
+
     def get_context_content_name(self):
         return self.context_content_name
 
+    def _get_context_content_name(self):
+        """Return get_context_content_name(). A found name is stored for the rest of the request."""
+        name = self._context_content_name
+        if name is None:
+            name = self.get_context_content_name()
+            if name:
+                self._context_content_name = name
+        return name
+
     def get_queryset(self):
         """Return the queryset."""
         try:
@@ -67,25 +279,27 @@ class ViewMixin(object):
 
     def get_view_queryset(self, queryset=None):
         """Get and modify the content queryset."""
-        # Get the queryset or parent object
+        # Get the queryset or parent object. Reuse the object or object_list that get() already retrieved.
         if hasattr(self, 'get_object'):
-            qs = self.get_object(queryset=queryset)
+            qs = getattr(self, "object", None) if queryset is None else None
+            if qs is None:
+                qs = self.get_object(queryset=queryset)
         else:
-            qs = self.get_queryset()
+            qs = getattr(self, "object_list", None)
+            if qs is None:
+                qs = self.get_queryset()
         obj = self.content_parent = qs
 
         # Check if the view queryset is retrieved from the obj
         context_object_name = get_context_object_name(self)
-        context_content_name = self.get_context_content_name()
+        context_content_name = self._get_context_content_name()
         if context_content_name and context_object_name != context_content_name and hasattr(obj, context_content_name):
-            try:
-                qs = getattr(obj, context_content_name)
-                if callable(qs):
-                    qs = qs()
-                else:
-                    qs = qs.all()
-            except:
-                pass
+            qs = getattr(obj, context_content_name)
+            if isinstance(qs, (BaseManager, QuerySet)):
+                # Related managers are callable too. all() uses the prefetch_related cache if there is one.
+                qs = qs.all()
+            elif callable(qs):
+                qs = qs()
 
         self.content_raw = qs
         return self.modify_queryset(qs, parent=obj)
@@ -111,7 +325,7 @@ class ViewMixin(object):
 
     def set_content_object(self, context, qs, **kwargs):
         context["modified_qs"] = qs
-        context[self.get_context_content_name() or get_context_object_name(self)] = qs
+        context[self._get_context_content_name() or get_context_object_name(self)] = qs
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -124,17 +338,50 @@ class ViewMixin(object):
         return context
 
 
+_cached_form_filter_classes = {}
+
+
+def get_cached_form_filter_class(filter_class):
+    """Return a subclass of the django-filter FilterSet class that builds its form class only once.
+
+    FilterSet.get_form_class() creates a new form class from the filters on every instance. The subclass keeps the
+    first form class, so only the request data is bound per request. Do not use this when a filter's form field
+    depends on the request (callable querysets).
+    """
+    try:
+        return _cached_form_filter_classes[filter_class]
+    except KeyError:
+        pass
+
+    form_classes = []
+
+    def get_form_class(self):
+        if not form_classes:
+            form_classes.append(super(cached_class, self).get_form_class())
+        return form_classes[0]
+
+    cached_class = type(filter_class.__name__, (filter_class,), {"__module__": filter_class.__module__,
+                                                                 "get_form_class": get_form_class})
+    _cached_form_filter_classes[filter_class] = cached_class
+    return cached_class
+
+
 class FilterMixin(ViewMixin):
-    """Support for django-filter"""
+    """Support for django-filter
+
+    Set cache_filter_form = True to build the filter form class once per filter_class instead of every request.
+    """
     filter_class = None
     context_filter_name = 'filter'
+    cache_filter_form = False
 
-    def __init__(self, *args, **kwargs):
-        self._filter = None
-        super().__init__(*args, **kwargs)
+    _filter = None
 
     def filter_qs(self, qs):
-        filt = self.filter_class(self.request.GET, queryset=qs)
+        filter_class = self.filter_class
+        if self.cache_filter_form:
+            filter_class = get_cached_form_filter_class(filter_class)
+        filt = filter_class(self.request.GET, queryset=qs)
         return filt, filt.qs
 
     def _modify_queryset(self, qs, page_size=None, **kwargs):
@@ -168,23 +415,23 @@ class PaginatorMixin(ViewMixin):
     allow_empty = True
     paginate_by = None
     paginate_orphans = 0
-    paginator_class = Paginator
+    paginator_class = PkSlicePaginator
     page_kwarg = 'page'
     ordering = None
 
+    _is_paginator = True
+
+    _paginator = None
+    _page_queryset = None
+    _page = None
+    _is_paginated = None
+
     def get_context_content_name(self):
         return super().get_context_content_name() or self.get_context_paginated_name()
 
     def get_context_paginated_name(self):
         return self.context_paginated_name or get_context_object_name(self)
 
-    def __init__(self, *args, **kwargs):
-        self._paginator = None
-        self._page_queryset = None
-        self._page = None
-        self._is_paginated = None
-        super().__init__(*args, **kwargs)
-
     # ===== Pagination Methods from ListView =====
     get_paginate_by = MultipleObjectMixin.get_paginate_by
     get_paginator = MultipleObjectMixin.get_paginator
@@ -210,9 +457,13 @@ class PaginatorMixin(ViewMixin):
 
         This method fixes issues if ListView is a base class.
         """
+        if self._paginator is not None:
+            # modify_queryset already paginated. Do not count and slice the queryset again.
+            return self._paginator, self._page, self._page_queryset, self._is_paginated
+
         if self._modified_qs is None and self.paginate_by:
-            queryset = self.modify_queryset(queryset, page_size=page_size)
-            return self._paginator, self._page, queryset, self._is_paginated
+            self.modify_queryset(queryset, page_size=page_size)
+            return self._paginator, self._page, self._page_queryset, self._is_paginated
 
         return self._paginate_queryset(queryset, page_size)
     # ===== END Pagination Methods from ListView =====
@@ -294,9 +545,8 @@ class SortableTableMixin(PaginatorMixin):
     context_table_name = "table"
     order_by_name = "order_by"
 
-    def __init__(self, *args, **kwargs):
-        self._table = None
-        super().__init__(*args, **kwargs)
+    _is_sortable = True
+    _table = None
 
     def get_order_by_name(self):
         if self.order_by_name:
@@ -333,6 +583,60 @@ class SortableTableMixin(PaginatorMixin):
         context[self.context_table_name] = self._table
 
 
+def is_ajax(request):
+    """Return if the request was made with XMLHttpRequest (HttpRequest.is_ajax() was removed in Django 4.0)."""
+    return request.META.get("HTTP_X_REQUESTED_WITH") == "XMLHttpRequest"
+
+
+_json_encoder = DjangoJSONEncoder()
+
+
+def json_response(data, status=200, safe=True):
+    """Return a json HttpResponse for the ajax data.
+
+    Uses orjson when it is installed and falls back to JsonResponse. Types orjson does not support (Decimal, lazy
+    translation strings, ...) and datetimes are converted with the DjangoJSONEncoder, so the output matches
+    JsonResponse. Data orjson cannot serialize at all (integers wider than 64 bits, ...) is given to JsonResponse.
+    Like JsonResponse only a dict is allowed unless safe is False.
+
+    NaN and Infinity floats differ: orjson writes null, JsonResponse writes NaN/Infinity (which is not valid json).
+    """
+    if safe and not isinstance(data, dict):
+        raise TypeError("In order to allow non-dict objects to be serialized set the safe parameter to False.")
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, default=_json_encoder.default,
+                                   option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+        else:
+            return HttpResponse(content, content_type="application/json", status=status)
+    return JsonResponse(data, status=status, safe=safe)
+
+
+_model_attnames = {}
+_model_caps = {}
+
+
+def get_model_attnames(model):
+    """Return a tuple of the field attnames for a model class. The result is cached per class."""
+    try:
+        return _model_attnames[model]
+    except KeyError:
+        attnames = _model_attnames[model] = tuple(field.attname for field in model._meta.fields)
+        return attnames
+
+
+def get_model_caps(model):
+    """Return (has_get_absolute_url, has_get_update_url) for a model class. The result is cached per class."""
+    try:
+        return _model_caps[model]
+    except KeyError:
+        caps = _model_caps[model] = (callable(getattr(model, "get_absolute_url", None)),
+                                     callable(getattr(model, "get_update_url", None)))
+        return caps
+
+
 class AjaxableResponseMixin(ViewMixin):
     """Easily add Ajax support to a view.
 
@@ -350,6 +654,21 @@ class AjaxableResponseMixin(ViewMixin):
 
         get_ajax_data (function): Return a dictionary to customize the json data in the json response.
 
+        ajax_use_values (bool): Serialize QuerySets with QuerySet.values() instead of building Model objects. Only
+            concrete fields are returned and get_json_data receives the row dictionary as the data object.
+        ajax_include_methods (bool): Keep the Model object path (str, get_absolute_url, table column methods) even
+            when ajax_use_values is True.
+        ajax_json_fields (list): Names to put in the json data instead of all of the model fields and table columns.
+            With ajax_use_values these must be valid QuerySet.values() names.
+        ajax_include_str (bool): Add str(obj) as "str" to the json data. Set False when __str__ follows relations
+            to avoid a query per row.
+        ajax_select_related (tuple): ForeignKey/OneToOneField names to select_related for the ajax object_list, so
+            str() and column methods do not run a query per row.
+        ajax_prefetch_related (tuple): ManyToManyField/reverse ForeignKey names to prefetch_related for the ajax
+            object_list.
+        get_ajax_select_related (function): Same as ajax_select_related
+        get_ajax_prefetch_related (function): Same as ajax_prefetch_related
+
     Using the POST method (FormView, CreateView, UpdateView):
         get_post_ajax_data (function): Automatically returns the object that was updated.
 
@@ -357,11 +676,20 @@ class AjaxableResponseMixin(ViewMixin):
             in the json response.
     """
     context_ajax_name = None
+    ajax_use_values = False
+    ajax_include_methods = False
+    ajax_json_fields = None
+    ajax_include_str = True
+    ajax_select_related = ()
+    ajax_prefetch_related = ()
+
+    _paginator = None
+    _page = None
+    _row_idx = None
 
     def __init__(self, *args, **kwargs):
-        self._paginator = None
-        self._page = None
-        self._row_idx = None
+        self._json_fields = {}
+        self._json_formatters = {}
         super().__init__(*args, **kwargs)
 
     def get_context_content_name(self):
@@ -388,44 +716,137 @@ class AjaxableResponseMixin(ViewMixin):
             if callable(value):
                 return value()
             return value
-        except:
+        except Exception:
             return None
 
+    def get_json_fields(self, data):
+        """Return the list of field and column names to put in the json data for a Model object.
+
+        The list is built once per model class for the request.
+        """
+        model = type(data)
+        try:
+            return self._json_fields[model]
+        except KeyError:
+            pass
+
+        if self.ajax_json_fields is not None:
+            fields = self._json_fields[model] = list(self.ajax_json_fields)
+            return fields
+
+        fields = list(get_model_attnames(model))
+        columns = None
+        if self._is_sortable:
+            if self._table:
+                columns = self._table.columns
+            elif self.table:
+                columns = self.table.base_columns
+        if columns:
+            names = set(fields)
+            fields.extend([col.name for col in columns if col.name not in names])
+
+        self._json_fields[model] = fields
+        return fields
+
+    def get_json_formatter(self, data):
+        """Return a function(data, row_idx) that builds the default json dictionary for a Model object.
+
+        The method checks and field getters are resolved once per model class for the request. Model fields are
+        read with a single attrgetter; other names (table columns) may be methods or may not exist, so they use
+        getattr_or_value.
+        """
+        model = type(data)
+        try:
+            return self._json_formatters[model]
+        except KeyError:
+            pass
+
+        has_absolute_url, has_update_url = get_model_caps(model)
+        attnames = get_model_attnames(model)
+        fields = self.get_json_fields(data)
+        attr_names = tuple(name for name in fields if name in attnames)
+        other_names = [name for name in fields if name not in attnames]
+        get_attrs = operator.attrgetter(*attr_names) if len(attr_names) > 1 else None
+        include_str = self.ajax_include_str
+        getattr_or_value = self.getattr_or_value
+
+        def formatter(obj, row_idx):
+            d = {"row_idx": row_idx}
+            if has_absolute_url:
+                try:
+                    d["get_absolute_url"] = obj.get_absolute_url()
+                except NoReverseMatch:
+                    pass
+            if has_update_url:
+                try:
+                    d["get_update_url"] = obj.get_update_url()
+                except NoReverseMatch:
+                    pass
+            if include_str:
+                d["str"] = str(obj)
+
+            # Capture fields
+            if get_attrs is not None:
+                d.update(zip(attr_names, get_attrs(obj)))
+            else:
+                for name in attr_names:
+                    d[name] = getattr(obj, name)
+            for name in other_names:
+                d[name] = getattr_or_value(obj, name)
+            return d
+
+        self._json_formatters[model] = formatter
+        return formatter
+
+    def get_json_value_fields(self, model):
+        """Return the field names to select with QuerySet.values() when ajax_use_values is True."""
+        try:
+            return self._json_fields[model, "values"]
+        except KeyError:
+            pass
+
+        if self.ajax_json_fields is not None:
+            fields = self._json_fields[model, "values"] = list(self.ajax_json_fields)
+            return fields
+
+        fields = list(get_model_attnames(model))
+        if self._is_sortable:
+            columns = self._table.columns if self._table else (self.table.base_columns if self.table else None)
+            if columns:
+                names = set(fields)
+                fields.extend([col.name for col in columns
+                               if col.name not in names and is_concrete_field(model, col.name)])
+
+        self._json_fields[model, "values"] = fields
+        return fields
+
+    def _next_row_idx(self):
+        if self._row_idx is not None:
+            self._row_idx += 1
+        elif self._paginator is not None and self._page is not None:
+            self._row_idx = self._paginator.per_page * (self._page.number - 1)
+        return self._row_idx
+
+    def format_json_values(self, qs):
+        """Return the json data for a QuerySet using QuerySet.values()."""
+        data = []
+        for d in qs.values(*self.get_json_value_fields(qs.model)):
+            d["row_idx"] = self._next_row_idx()
+
+            # Update the json_dict (d) or replace it by returning a new json_dict
+            alt_data = self.get_json_data(d, d)
+            if isinstance(alt_data, dict):
+                d = alt_data
+            data.append(d)
+        return data
+
     def format_json_data(self, data):
         if isinstance(data, QuerySet):
+            if self.ajax_use_values and not self.ajax_include_methods:
+                return self.format_json_values(data)
             return [self.format_json_data(obj) for obj in data]
         elif isinstance(data, Model):
-            d = {}
-
-            # Defaults
-            try:
-                if self._row_idx is None:
-                    if self._paginator and self._page:
-                        self._row_idx = self._paginator.per_page * (self._page.number - 1)
-                else:
-                    self._row_idx += 1
-                d["row_idx"] = self._row_idx
-            except (AttributeError, Exception):
-                pass
-            try:
-                d["get_absolute_url"] = data.get_absolute_url()
-            except (AttributeError, Exception):
-                pass
-            try:
-                d["get_update_url"] = data.get_update_url()
-            except (AttributeError, Exception):
-                pass
-            d["str"] = str(data)
-
-            # Capture fields
-            fields = [field.attname for field in data._meta.fields]
-            if isinstance(self, SortableTableMixin):
-                if self._table:
-                    fields.extend([col.name for col in self._table.columns if col.name not in fields])
-                elif self.table:
-                    fields.extend([col.name for col in self.table.base_columns if col.name not in fields])
-
-            d.update({field: self.getattr_or_value(data, field) for field in fields})
+            d = self.get_json_formatter(data)(data, self._next_row_idx())
 
             # Update the json_dict (d) or replace it by returning a new json_dict
             alt_data = self.get_json_data(data, d)
@@ -439,7 +860,7 @@ class AjaxableResponseMixin(ViewMixin):
         """Returns a list of ajax context names to return in json."""
         if self.context_ajax_name:
             return self.context_ajax_name
-        elif isinstance(self, PaginatorMixin):
+        elif self._is_paginator:
             return self.get_context_paginated_name()
         return None
 
@@ -474,32 +895,50 @@ class AjaxableResponseMixin(ViewMixin):
                 }
             )
 
+    def get_ajax_select_related(self):
+        return self.ajax_select_related
+
+    def get_ajax_prefetch_related(self):
+        return self.ajax_prefetch_related
+
+    def get_ajax_queryset(self):
+        """Return the object_list for an ajax GET request with the ajax related lookups applied."""
+        qs = self.get_queryset()
+        select_related = self.get_ajax_select_related()
+        if select_related:
+            qs = qs.select_related(*select_related)
+        prefetch_related = self.get_ajax_prefetch_related()
+        if prefetch_related:
+            qs = qs.prefetch_related(*prefetch_related)
+        return qs
+
     def get(self, request, *args, **kwargs):
-        if request.is_ajax():
-            if isinstance(self, MultipleObjectMixin):
-                self.object_list = self.get_queryset()
+        if is_ajax(request):
+            if self._is_multiple_object:
+                self.object_list = self.get_ajax_queryset()
                 kwargs["object_list"] = self.object_list
-            elif isinstance(self, SingleObjectMixin):
+            elif self._is_single_object:
                 self.object = self.get_object()
                 kwargs["object"] = self.object
             context = self.get_context_data(**kwargs)
             data = self.get_ajax_data(context)
-            return JsonResponse(data, status=200)
+            return json_response(data, status=200)
         else:
             return super().get(request, *args, **kwargs)
 
     def set_content_object(self, context, qs, **kwargs):
         super().set_content_object(context, qs, **kwargs)
 
-        context[self.get_context_ajax_name()] = qs
+        context_ajax_name = self.get_context_ajax_name()
+        context[context_ajax_name] = qs
         context["has_ajax_support"] = True
-        context["context_ajax_name"] = self.get_context_ajax_name()
+        context["context_ajax_name"] = context_ajax_name
     # ========== END GET Method ==========
 
     # ========== POST Method ==========
     def form_invalid(self, form):
         response = super(AjaxableResponseMixin, self).form_invalid(form)
-        if self.request.is_ajax():
+        if is_ajax(self.request):
             return JsonResponse(form.errors, status=400)
         else:
             return response
@@ -514,9 +953,9 @@ class AjaxableResponseMixin(ViewMixin):
             form.instance.user = self.request.user
 
         response = super().form_valid(form)
-        if self.request.is_ajax():
+        if is_ajax(self.request):
             data = self.get_post_ajax_data()
-            return JsonResponse(data)
+            return json_response(data)
         else:
             return response
     # ========== END POST Method ==========
@@ -542,11 +981,8 @@ class FormMixin(ViewMixin):
     form_queryset_kwarg = "queryset"
     template_name_suffix = '_merge'  # template_name = "app/model_merge.html"
 
-    def __init__(self, *args, **kwargs):
-        self._modified_qs = None
-        self.object_list = None
-        self.object = None
-        super().__init__(*args, **kwargs)
+    object_list = None
+    object = None
 
     def get_form_kwargs(self):
         """Return the keyword arguments for instantiating the form."""